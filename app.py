@@ -7,7 +7,7 @@ from backend.coaching.nutrition_coach import NutritionCoach
 import logging
 from logging.handlers import RotatingFileHandler
 import os
-import traceback
+from functools import wraps
 
 # Configuration du logging
 if not os.path.exists('logs'):
@@ -34,156 +34,141 @@ try:
     coach = NutritionCoach()
     app.logger.info('Composants initialisés avec succès')
 except Exception as e:
-    app.logger.error(f'Erreur lors de l\'initialisation des composants: {str(e)}')
-    traceback.print_exc()
+    app.logger.exception('Erreur lors de l\'initialisation des composants: %s', e)
+
+def handle_errors(message, status=400):
+    """Journalise les erreurs d'une route et les renvoie au format JSON"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            try:
+                return view(*args, **kwargs)
+            except Exception as e:
+                app.logger.exception('%s: %s', message, e)
+                return jsonify({'error': str(e)}), status
+        return wrapper
+    return decorator
 
 @app.route('/')
+@handle_errors('Erreur page d\'accueil', status=500)
 def home():
     """Page d'accueil"""
-    try:
-        app.logger.info('Accès à la page d\'accueil')
-        return render_template('index.html')  # Changé pour index.html
-    except Exception as e:
-        app.logger.error(f'Erreur page d\'accueil: {str(e)}')
-        return jsonify({'error': str(e)}), 500
+    app.logger.info('Accès à la page d\'accueil')
+    return render_template('index.html')  # Changé pour index.html
 
 @app.route('/api/goals', methods=['POST'])
+@handle_errors('Erreur calcul objectifs')
 def calculate_goals():
     """Calcule les objectifs personnalisés"""
-    try:
-        data = request.json
-        app.logger.info(f'Calcul des objectifs pour: {data}')
-        goals_data = goals.calculate_goals(
-            age=data.get('age', 52),
-            sexe=data.get('sexe', 'M'),
-            poids=data.get('poids', 80),
-            taille=data.get('taille', 179),
-            niveau_activite=data.get('niveau_activite', 'actif'),
-            objectif=data.get('objectif', 'perte'),
-            poids_cible=data.get('poids_cible', 78),
-            delai_semaines=data.get('delai_semaines', 6)
-        )
-        return jsonify(goals_data)
-    except Exception as e:
-        app.logger.error(f'Erreur calcul objectifs: {str(e)}')
-        return jsonify({'error': str(e)}), 400
+    data = request.json
+    app.logger.info('Calcul des objectifs pour: %s', data)
+    goals_data = goals.calculate_goals(
+        age=data.get('age', 52),
+        sexe=data.get('sexe', 'M'),
+        poids=data.get('poids', 80),
+        taille=data.get('taille', 179),
+        niveau_activite=data.get('niveau_activite', 'actif'),
+        objectif=data.get('objectif', 'perte'),
+        poids_cible=data.get('poids_cible', 78),
+        delai_semaines=data.get('delai_semaines', 6)
+    )
+    return jsonify(goals_data)
 
 @app.route('/api/meals/daily', methods=['GET'])
+@handle_errors('Erreur génération plan repas')
 def get_daily_plan():
     """Génère un plan de repas journalier"""
-    try:
-        app.logger.info('Génération du plan journalier')
-        daily_plan = planner.generate_daily_plan()
-        return jsonify(daily_plan)
-    except Exception as e:
-        app.logger.error(f'Erreur génération plan repas: {str(e)}')
-        return jsonify({'error': str(e)}), 400
+    app.logger.info('Génération du plan journalier')
+    daily_plan = planner.generate_daily_plan()
+    return jsonify(daily_plan)
 
 @app.route('/api/tracking/log-meal', methods=['POST'])
+@handle_errors('Erreur enregistrement repas')
 def log_meal():
     """Enregistre un repas"""
-    try:
-        data = request.json
-        app.logger.info(f'Enregistrement du repas: {data}')
-        progress = tracker.log_meal(
-            meal_type=data.get('meal_type', 'dejeuner'),
-            calories=data.get('calories', 0),
-            proteines=data.get('proteines', 0),
-            glucides=data.get('glucides', 0),
-            lipides=data.get('lipides', 0),
-            aliments=data.get('aliments', [])
-        )
-        return jsonify(progress)
-    except Exception as e:
-        app.logger.error(f'Erreur enregistrement repas: {str(e)}')
-        return jsonify({'error': str(e)}), 400
+    data = request.json
+    app.logger.info('Enregistrement du repas: %s', data)
+    progress = tracker.log_meal(
+        meal_type=data.get('meal_type', 'dejeuner'),
+        calories=data.get('calories', 0),
+        proteines=data.get('proteines', 0),
+        glucides=data.get('glucides', 0),
+        lipides=data.get('lipides', 0),
+        aliments=data.get('aliments', [])
+    )
+    return jsonify(progress)
 
 @app.route('/api/tracking/log-water', methods=['POST'])
+@handle_errors('Erreur enregistrement eau')
 def log_water():
     """Enregistre la consommation d'eau"""
-    try:
-        data = request.json
-        app.logger.info(f'Enregistrement eau: {data}')
-        progress = tracker.log_water(quantity_ml=data.get('quantity_ml', 0))
-        return jsonify(progress)
-    except Exception as e:
-        app.logger.error(f'Erreur enregistrement eau: {str(e)}')
-        return jsonify({'error': str(e)}), 400
+    data = request.json
+    app.logger.info('Enregistrement eau: %s', data)
+    progress = tracker.log_water(quantity_ml=data.get('quantity_ml', 0))
+    return jsonify(progress)
 
 @app.route('/api/tracking/log-exercise', methods=['POST'])
+@handle_errors('Erreur enregistrement exercice')
 def log_exercise():
     """Enregistre une activité physique"""
-    try:
-        data = request.json
-        app.logger.info(f'Enregistrement exercice: {data}')
-        progress = tracker.log_exercise(
-            activity=data.get('activity', ''),
-            duration=data.get('duration', 0),
-            intensity=data.get('intensity', 'modérée'),
-            calories_burned=data.get('calories_burned', 0)
-        )
-        return jsonify(progress)
-    except Exception as e:
-        app.logger.error(f'Erreur enregistrement exercice: {str(e)}')
-        return jsonify({'error': str(e)}), 400
+    data = request.json
+    app.logger.info('Enregistrement exercice: %s', data)
+    progress = tracker.log_exercise(
+        activity=data.get('activity', ''),
+        duration=data.get('duration', 0),
+        intensity=data.get('intensity', 'modérée'),
+        calories_burned=data.get('calories_burned', 0)
+    )
+    return jsonify(progress)
 
 @app.route('/api/tracking/daily-summary', methods=['GET'])
+@handle_errors('Erreur génération résumé')
 def get_daily_summary():
     """Obtient le résumé journalier"""
-    try:
-        app.logger.info('Récupération du résumé journalier')
-        summary = tracker.get_daily_summary()
-        return jsonify(summary)
-    except Exception as e:
-        app.logger.error(f'Erreur génération résumé: {str(e)}')
-        return jsonify({'error': str(e)}), 400
+    app.logger.info('Récupération du résumé journalier')
+    summary = tracker.get_daily_summary()
+    return jsonify(summary)
 
 @app.route('/api/visualization/dashboard', methods=['GET'])
+@handle_errors('Erreur génération dashboard')
 def get_dashboard():
     """Génère le tableau de bord"""
-    try:
-        app.logger.info('Génération du tableau de bord')
-        dashboard = visualizer.create_dashboard(
-            poids_initial=80,
-            poids_cible=78,
-            delai_semaines=6,
-            calories=2650,
-            proteines=230,
-            glucides=265,
-            lipides=75,
-            hydratation=3600
-        )
-        return jsonify(dashboard)
-    except Exception as e:
-        app.logger.error(f'Erreur génération dashboard: {str(e)}')
-        return jsonify({'error': str(e)}), 400
+    app.logger.info('Génération du tableau de bord')
+    dashboard = visualizer.create_dashboard(
+        poids_initial=80,
+        poids_cible=78,
+        delai_semaines=6,
+        calories=2650,
+        proteines=230,
+        glucides=265,
+        lipides=75,
+        hydratation=3600
+    )
+    return jsonify(dashboard)
 
 @app.route('/api/coach/guidance', methods=['GET'])
+@handle_errors('Erreur génération conseils')
 def get_guidance():
     """Obtient les conseils du coach"""
-    try:
-        app.logger.info('Récupération des conseils')
-        user_data = {
-            'calories': 2000,
-            'proteins': 150,
-            'carbs': 200,
-            'fats': 60,
-            'water': 2500
-        }
-        guidance = coach.get_daily_guidance(user_data)
-        return jsonify(guidance)
-    except Exception as e:
-        app.logger.error(f'Erreur génération conseils: {str(e)}')
-        return jsonify({'error': str(e)}), 400
+    app.logger.info('Récupération des conseils')
+    user_data = {
+        'calories': 2000,
+        'proteins': 150,
+        'carbs': 200,
+        'fats': 60,
+        'water': 2500
+    }
+    guidance = coach.get_daily_guidance(user_data)
+    return jsonify(guidance)
 
 @app.errorhandler(404)
 def not_found_error(error):
-    app.logger.error(f'Page non trouvée: {request.url}')
+    app.logger.error('Page non trouvée: %s', request.url)
     return jsonify({'error': 'Page non trouvée'}), 404
 
 @app.errorhandler(500)
 def internal_error(error):
-    app.logger.error(f'Erreur serveur: {error}')
+    app.logger.error('Erreur serveur: %s', error)
     return jsonify({'error': 'Erreur serveur interne'}), 500
 
 if __name__ == '__main__':
@@ -1,3 +1,19 @@
+# Multiplicateurs du métabolisme de base selon le niveau d'activité
+ACTIVITY_MULTIPLIERS = {
+    'sedentary': 1.2,
+    'light': 1.375,
+    'moderate': 1.55,
+    'active': 1.725,
+    'very_active': 1.9
+}
+
+# Ajustement calorique journalier selon l'objectif
+GOAL_ADJUSTMENTS = {
+    'lose': -500,    # Déficit calorique pour perdre du poids
+    'maintain': 0,   # Maintien du poids
+    'gain': 300      # Surplus calorique pour gagner du poids
+}
+
 class PersonalGoals:
     def __init__(self):
         self.weight_goal = None
@@ -14,24 +30,10 @@ class PersonalGoals:
             bmr = 10 * weight + 6.25 * height - 5 * age - 161
             
         # Ajustement selon le niveau d'activité
-        activity_multipliers = {
-            'sedentary': 1.2,
-            'light': 1.375,
-            'moderate': 1.55,
-            'active': 1.725,
-            'very_active': 1.9
-        }
-        
-        tdee = bmr * activity_multipliers.get(activity_level.lower(), 1.2)
+        tdee = bmr * ACTIVITY_MULTIPLIERS.get(activity_level.lower(), 1.2)
         
         # Ajustement selon l'objectif
-        goal_adjustments = {
-            'lose': -500,    # Déficit calorique pour perdre du poids
-            'maintain': 0,   # Maintien du poids
-            'gain': 300      # Surplus calorique pour gagner du poids
-        }
-        
-        self.calorie_goal = tdee + goal_adjustments.get(goal_type.lower(), 0)
+        self.calorie_goal = tdee + GOAL_ADJUSTMENTS.get(goal_type.lower(), 0)
         
         # Calcul des macronutriments
         self.protein_goal = weight * 2.2  # 2.2g par kg de poids corporel
@@ -22,10 +22,17 @@ class GoalVisualizer:
             }
             
         total_days = len(self.progress_data)
-        days_on_target = sum(1 for day in self.progress_data 
-                           if abs(day['net_calories'] - calorie_goal) <= 100)
-        
-        average_calories = sum(day['net_calories'] for day in self.progress_data) / total_days
+
+        # Un seul parcours pour les jours dans l'objectif et le total net
+        days_on_target = 0
+        total_net_calories = 0
+        for day in self.progress_data:
+            net_calories = day['net_calories']
+            total_net_calories += net_calories
+            if abs(net_calories - calorie_goal) <= 100:
+                days_on_target += 1
+
+        average_calories = total_net_calories / total_days
         
         return {
             'current_streak': self._calculate_streak(),